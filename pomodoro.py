@@ -10,7 +10,9 @@ import time
 import threading
 import sys
 import os
-from datetime import datetime
+import math
+import random
+from datetime import datetime, timedelta
 from pathlib import Path
 import queue
 import warnings
@@ -56,6 +58,19 @@ COLOR_SUCCESS = "green"
 # Lower = Faster, Higher = Slower. Default: 10 (approx 0.2s)
 CURSOR_BLINK_SPEED = 20
 
+# Word pools for synthetic notes (loadgen), grouped by script
+LOADGEN_WORDS = {
+    "ascii": ["fixed", "bug", "review", "refactor", "meeting", "docs", "tests", "deploy", "email",
+              "design", "parser", "timer", "notes", "draft", "call", "plan", "read", "chapter",
+              "focus", "break", "coffee", "done", "blocked", "todo", "(P)", "Disturbance!", "->", "50%"],
+    "latin": ["café", "naïve", "résumé", "über", "façade", "jalapeño", "smörgåsbord", "Ångström",
+              "crème", "brûlée", "señor", "coöperate", "Zürich", "fiancée", "déjà", "vu"],
+    "cjk": ["会議", "設計", "コード", "レビュー", "テスト", "测试", "数据", "文档", "문서", "작업", "회의"],
+    "emoji": ["🍅", "✅", "🚀", "🔥", "💡", "📝", "⏸️", "🎯", "👨‍💻", "🇯🇵"],
+}
+# Relative weight of each pool when --charset is "mixed"
+LOADGEN_MIX = {"ascii": 85, "latin": 8, "cjk": 5, "emoji": 2}
+
 # Try pygame first (most reliable)
 try:
     # Suppress pygame welcome message
@@ -81,6 +96,16 @@ if not AUDIO_AVAILABLE:
     print("Chimes will use system beep.\n")
 
 
+def format_note_line(when, phase, elapsed_mins, note_text):
+    """Format a note line as written to the notes file"""
+    return f"{when.strftime('[%Y-%m-%d %H:%M:%S]')} ({phase} - {elapsed_mins}): {note_text}\n"
+
+
+def format_goal_line(when, cycle, cycles, goal):
+    """Format a cycle goal line (preceded by a blank line) as written to the notes file"""
+    return f"\n{when.strftime('[%Y-%m-%d %H:%M:%S]')} (CYCLE {cycle} of {cycles} - GOAL): {goal}\n"
+
+
 class PomodoroTimer:
     def __init__(self, work_min, note_min, break_min, cycles, chime_file):
         self.work_duration = work_min * 60
@@ -139,21 +164,20 @@ class PomodoroTimer:
     def save_note(self, note_text):
         """Save a note with timestamp, elapsed minutes, and current phase"""
         if note_text.strip():
-            timestamp = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
+            now = datetime.now()
             elapsed_mins = 0
             if self.phase_start_time:
-                elapsed_secs = (datetime.now() - self.phase_start_time).total_seconds()
+                elapsed_secs = (now - self.phase_start_time).total_seconds()
                 elapsed_mins = int(elapsed_secs // 60)
-            phase_label = f"({self.current_phase} - {elapsed_mins})"
             
             with open(self.notes_file, 'a', encoding='utf-8') as f:
-                f.write(f"{timestamp} {phase_label}: {note_text}\n")
+                f.write(format_note_line(now, self.current_phase, elapsed_mins, note_text))
             
             # Print the note above the timer using rich console
             console.print(f"[{COLOR_SUCCESS}] ✓ Added:[/{COLOR_SUCCESS}] {note_text[:40]}{'...' if len(note_text) > 40 else ''}")
     
-    def ask_for_goal(self, cycle):
-        """Ask user for their goal/target before starting a cycle"""
+    def ask_for_goal(self, cycle, goal=None):
+        """Ask user for their goal/target before starting a cycle (or use the given goal)"""
         self.accepting_notes = False  # Disable note saving
         self.line_buffer = ""  # Clear any partial input
         
@@ -178,12 +202,15 @@ class PomodoroTimer:
         console.print()
         
         console.print(f"[{COLOR_TIP}]{input_prompt}[/{COLOR_TIP}]", end="")
-        goal = input().strip()
+        if goal is None:
+            goal = input()
+        else:
+            console.print(goal)
+        goal = goal.strip()
         
         if goal:
-            timestamp = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
             with open(self.notes_file, 'a', encoding='utf-8') as f:
-                f.write(f"\n{timestamp} (CYCLE {cycle} of {self.cycles} - GOAL): {goal}\n")
+                f.write(format_goal_line(datetime.now(), cycle, self.cycles, goal))
             console.print(f"[{COLOR_SUCCESS}]✓ Goal saved successfully![/{COLOR_SUCCESS}]")
         else:
             console.print("No goal set.")
@@ -439,6 +466,158 @@ class PomodoroTimer:
             time.sleep(0.5)  # Give threads time to clean up
 
 
+class LoadGenerator:
+    """Deterministic generator of synthetic notes file histories for scale testing"""
+
+    def __init__(self, seed=0, years=1, cycles_per_day=4, notes_per_phase=2, note_length=60,
+                 note_dist="lognormal", charset="mixed", rest_days=0.25,
+                 work_min=25, note_min=5, break_min=10, start_date=None):
+        self.rng = random.Random(seed)
+        self.years = years
+        self.cycles_per_day = cycles_per_day
+        self.notes_per_phase = notes_per_phase
+        self.note_length = note_length
+        self.note_dist = note_dist
+        self.charset = charset
+        self.rest_days = rest_days
+        self.work_duration = work_min * 60
+        self.note_duration = note_min * 60
+        self.break_duration = break_min * 60
+        self.start_date = start_date or datetime(2020, 1, 1)
+
+        # Flatten the word pools once so note_text can draw words in batches
+        pools = LOADGEN_MIX if charset == "mixed" else {charset: 1}
+        self.words = []
+        self.cum_weights = []
+        total = 0
+        for pool, weight in pools.items():
+            for word in LOADGEN_WORDS[pool]:
+                total += weight / len(LOADGEN_WORDS[pool])
+                self.words.append(word)
+                self.cum_weights.append(total)
+
+    def note_text(self):
+        """Build a note whose length (in characters) follows the configured distribution"""
+        if self.note_dist == "fixed":
+            target = self.note_length
+        elif self.note_dist == "uniform":
+            target = self.rng.randint(1, 2 * self.note_length)
+        else:  # lognormal: mostly short notes with the occasional long one
+            target = int(self.rng.lognormvariate(math.log(self.note_length), 0.75))
+        
+        target = max(1, target)
+        words = []
+        length = 0
+        while length < target:
+            for word in self.rng.choices(self.words, cum_weights=self.cum_weights, k=target // 6 + 1):
+                words.append(word)
+                length += len(word) + 1
+                if length >= target:
+                    break
+        return " ".join(words)
+
+    def days(self):
+        """Yield (day, cycles) for every simulated working day.
+
+        Each cycle is (goal_time, goal, phases); each phase is (name, start, duration_secs, notes)
+        and each note is (offset_secs, text), mirroring what PomodoroTimer.start() would record.
+        """
+        day = self.start_date
+        end = self.start_date + timedelta(days=round(365.25 * self.years))
+        while day < end:
+            if self.rng.random() >= self.rest_days:
+                yield day, self._cycles_for(day)
+            day += timedelta(days=1)
+
+    def _cycles_for(self, day, count=None):
+        """Simulate one day's session of count cycles (around cycles_per_day by default), starting some time in the morning"""
+        if count is None:
+            count = self.rng.randint(1, max(1, 2 * self.cycles_per_day - 1))
+        clock = day.replace(hour=self.rng.randint(7, 10), minute=self.rng.randint(0, 59),
+                            second=self.rng.randint(0, 59))
+        cycles = []
+        for cycle in range(1, count + 1):
+            goal_time = clock
+            goal = self.note_text()
+            clock += timedelta(seconds=self.rng.randint(10, 60))  # Typing the goal + countdown
+
+            plan = [("Work", self.work_duration), ("Journal", self.note_duration)]
+            if cycle < count:
+                plan.append(("Break", self.break_duration))
+
+            phases = []
+            for name, duration in plan:
+                offsets = sorted(int(self.rng.random() * duration)
+                                 for _ in range(self.rng.randint(0, 2 * self.notes_per_phase)))
+                phases.append((name, clock, duration, [(offset, self.note_text()) for offset in offsets]))
+                clock += timedelta(seconds=duration)
+            cycles.append((goal_time, goal, phases))
+        return cycles
+
+    def write(self, path, append=False):
+        """Write the generated history to path, returning (days, entries)"""
+        days = 0
+        entries = 0
+        with open(path, 'a' if append else 'w', encoding='utf-8') as f:
+            for day, cycles in self.days():
+                days += 1
+                for cycle, (goal_time, goal, phases) in enumerate(cycles, 1):
+                    f.write(format_goal_line(goal_time, cycle, len(cycles), goal))
+                    entries += 1
+                    for name, start, duration, notes in phases:
+                        for offset, text in notes:
+                            f.write(format_note_line(start + timedelta(seconds=offset), name, offset // 60, text))
+                            entries += 1
+        return days, entries
+
+    def replay(self, timer, type_delay=0.02):
+        """Type a generated day of timer.cycles cycles into a running timer, scaled to its phase lengths"""
+        cycles = self._cycles_for(self.start_date, timer.cycles)
+        durations = {"Work": timer.work_duration, "Journal": timer.note_duration, "Break": timer.break_duration}
+
+        for cycle, (goal_time, goal, phases) in enumerate(cycles, 1):
+            timer.ask_for_goal(cycle, goal=goal)
+
+            for name, start, duration, notes in phases:
+                if name == "Break" and cycle == timer.cycles:
+                    break
+                scale = durations[name] / duration if duration else 0
+                phase_over = threading.Event()
+                typist = threading.Thread(target=self._type_notes,
+                                          args=(timer, [(offset * scale, text) for offset, text in notes],
+                                                durations[name], type_delay, phase_over),
+                                          daemon=True)
+                typist.start()
+                timer.run_timer(durations[name], name)
+
+                # Finish any note still being typed and save it before the phase changes
+                phase_over.set()
+                typist.join()
+                timer.process_notes()
+                if timer.stop_timer:
+                    return
+
+    @staticmethod
+    def _type_notes(timer, notes, duration, type_delay, phase_over):
+        """Type notes key by key into the timer's line buffer, the way listen_for_notes does.
+
+        Keystrokes speed up so each note is done before the next one (or the end of the phase)
+        is due, and the rest is typed at once when phase_over is set.
+        """
+        started = time.time()
+        for i, (offset, text) in enumerate(notes):
+            phase_over.wait(max(0, started + offset - time.time()))
+            due = notes[i + 1][0] if i + 1 < len(notes) else duration * 0.9
+            delay = min(type_delay, max(0, due - offset) / len(text))
+            for char in text:
+                if timer.stop_timer:
+                    return
+                timer.line_buffer += char
+                phase_over.wait(delay)
+            timer.note_queue.put(timer.line_buffer)
+            timer.line_buffer = ""
+
+
 def find_wav_files():
     """Find all .wav files in sounds directory"""
     wav_files = []
@@ -484,6 +663,103 @@ def select_chime():
             return None
 
 
+def positive_int(value):
+    """argparse type: an integer greater than zero"""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def non_negative_int(value):
+    """argparse type: an integer of zero or more"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be zero or more, got {value}")
+    return number
+
+
+def positive_float(value):
+    """argparse type: a number greater than zero"""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return number
+
+
+def non_negative_float(value):
+    """argparse type: a number of zero or more"""
+    number = float(value)
+    if not number >= 0:
+        raise argparse.ArgumentTypeError(f"must be zero or more, got {value}")
+    return number
+
+
+def fraction(value):
+    """argparse type: a number from 0 up to (but not including) 1"""
+    number = float(value)
+    if not 0 <= number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 0 and less than 1, got {value}")
+    return number
+
+
+def date_arg(value):
+    """argparse type: a date written as YYYY-MM-DD"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be a date as YYYY-MM-DD, got {value}")
+
+
+def run_loadgen(args):
+    """Generate a synthetic notes file, or replay generated notes against a live timer"""
+    generator = LoadGenerator(
+        seed=args.seed,
+        years=args.years,
+        cycles_per_day=args.cycles_per_day,
+        notes_per_phase=args.notes_per_phase,
+        note_length=args.note_length,
+        note_dist=args.note_dist,
+        charset=args.charset,
+        rest_days=args.rest_days,
+        work_min=args.work,
+        note_min=args.note,
+        break_min=args.break_time,
+        start_date=args.start
+    )
+
+    if args.replay:
+        timer = PomodoroTimer(work_min=0, note_min=0, break_min=0, cycles=args.cycles_per_day, chime_file=None)
+        timer.work_duration = timer.note_duration = timer.break_duration = args.phase_seconds
+        timer.notes_file = args.output
+        timer.accepting_notes = True
+        try:
+            generator.replay(timer, args.type_delay)
+        except KeyboardInterrupt:
+            console.print(f"\n[{COLOR_HEADER}]⏸️ Replay stopped by user (Ctrl+C pressed)[/{COLOR_HEADER}]")
+        finally:
+            timer.stop_timer = True
+        console.print(f"[{COLOR_INFO}]📄 Replayed notes saved to: {args.output}[/{COLOR_INFO}]")
+        return
+
+    # Growth is measured from the bytes this run wrote, so appending to a large file doesn't skew it
+    size_before = os.path.getsize(args.output) if args.append and os.path.exists(args.output) else 0
+    started = time.time()
+    days, entries = generator.write(args.output, append=args.append)
+    elapsed = time.time() - started
+    size = os.path.getsize(args.output)
+    written = size - size_before
+
+    console.print(f"[{COLOR_SEPARATOR}]{'='*60}[/{COLOR_SEPARATOR}]")
+    console.print(f"  [{COLOR_HEADER}]🧪 SYNTHETIC HISTORY WRITTEN[/{COLOR_HEADER}]")
+    console.print(f"[{COLOR_SEPARATOR}]{'='*60}[/{COLOR_SEPARATOR}]")
+    console.print(f"[{COLOR_INFO}]File: {args.output} (seed {args.seed})[/{COLOR_INFO}]")
+    console.print(f"[{COLOR_INFO}]Days: {days:,} | Entries: {entries:,} | Written: {written / 1024 / 1024:.1f} MB | File size: {size / 1024 / 1024:.1f} MB[/{COLOR_INFO}]")
+    if days:
+        console.print(f"[{COLOR_INFO}]Growth: {written / days / 1024:.1f} KB/day | {written / days * 365.25 / 1024 / 1024:.1f} MB/year[/{COLOR_INFO}]")
+    console.print(f"[{COLOR_SUCCESS}]Generated in {elapsed:.1f}s[/{COLOR_SUCCESS}]")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='CLI Pomodoro Timer with note-taking capability',
@@ -501,6 +777,9 @@ Examples:
 
     # Quick test (1 min each phase)
     python pomodoro.py -w 1 -n 1 -b 1 -c 2
+
+    # Synthetic 10-year history for scale testing (see: python pomodoro.py loadgen -h)
+    python pomodoro.py loadgen --years 10 --cycles-per-day 8 --notes-per-phase 4
         """
     )
     
@@ -516,8 +795,65 @@ Examples:
                         help='Path to .wav file for chime sound')
     parser.add_argument('--select-chime', action='store_true',
                         help='Select chime from available .wav files')
+
+    subparsers = parser.add_subparsers(dest='command')
+    loadgen = subparsers.add_parser(
+        'loadgen',
+        help='Generate synthetic notes for scale testing',
+        description='Write a synthetic, seed-deterministic notes history, or replay generated notes against a live timer',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    # 1M+ entries over 20 years (~190 MB)
+    python pomodoro.py loadgen --years 20 --cycles-per-day 12 --notes-per-phase 8
+
+    # Long notes in Japanese/Chinese/Korean only
+    python pomodoro.py loadgen --charset cjk --note-dist uniform --note-length 200
+
+    # Type one generated day into a running timer (10 s phases)
+    python pomodoro.py loadgen --replay --phase-seconds 10 -c 2
+        """
+    )
+    loadgen.add_argument('--output', '-o', type=str, default='pomodoro_loadgen.txt',
+                         help='File to write (default: pomodoro_loadgen.txt)')
+    loadgen.add_argument('--append', action='store_true',
+                         help='Append to the output file instead of overwriting it')
+    loadgen.add_argument('--seed', type=int, default=0,
+                         help='Random seed; the same seed gives the same file (default: 0)')
+    loadgen.add_argument('--years', type=positive_float, default=1,
+                         help='Years of history to generate (default: 1)')
+    loadgen.add_argument('--start', type=date_arg, default=None,
+                         help='First day of the history, YYYY-MM-DD (default: 2020-01-01)')
+    loadgen.add_argument('--cycles-per-day', '-c', type=positive_int, default=4,
+                         help='Average cycles per working day; exact number of cycles with --replay (default: 4)')
+    loadgen.add_argument('--rest-days', type=fraction, default=0.25,
+                         help='Fraction of days with no session (default: 0.25)')
+    loadgen.add_argument('--notes-per-phase', type=non_negative_int, default=2,
+                         help='Average notes per Work/Journal/Break phase (default: 2)')
+    loadgen.add_argument('--note-length', type=positive_int, default=60,
+                         help='Typical note length in characters (default: 60)')
+    loadgen.add_argument('--note-dist', choices=['lognormal', 'uniform', 'fixed'], default='lognormal',
+                         help='Note length distribution (default: lognormal)')
+    loadgen.add_argument('--charset', choices=['mixed'] + list(LOADGEN_WORDS), default='mixed',
+                         help='Words used in notes (default: mixed)')
+    loadgen.add_argument('--work', '-w', type=non_negative_int, default=25,
+                         help='Work duration in minutes (default: 25)')
+    loadgen.add_argument('--note', '-n', type=non_negative_int, default=5,
+                         help='Note-taking duration in minutes (default: 5)')
+    loadgen.add_argument('--break', '-b', type=non_negative_int, default=10, dest='break_time',
+                         help='Break duration in minutes (default: 10)')
+    loadgen.add_argument('--replay', action='store_true',
+                         help='Type one generated day into a running timer instead of writing a history')
+    loadgen.add_argument('--phase-seconds', type=positive_int, default=10,
+                         help='Length of each phase when replaying (default: 10)')
+    loadgen.add_argument('--type-delay', type=non_negative_float, default=0.02,
+                         help='Seconds between replayed keystrokes (default: 0.02)')
     
     args = parser.parse_args()
+
+    if args.command == 'loadgen':
+        run_loadgen(args)
+        return
     
     # Handle chime selection
     chime_file = args.chime
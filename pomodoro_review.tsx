@@ -2,11 +2,11 @@
  * File: pomodoro_review.tsx
  * Description: Front-end React component for reviewing pomodoro entries with AI-generated summaries.
  * Parameters: None (client-side component).
- * Inputs: Loads `pomodoro.txt` from server or local storage, parses timestamped entries.
+ * Inputs: Loads `pomodoro.txt` from server or the IndexedDB cache, parses timestamped entries in a Web Worker.
  * Processing: Parses entries, groups by date/year/month, renders overview, allows AI summary generation via Google Gemini API, saves AI logs.
  * Outputs: Renders interactive UI with entry lists, date navigation, AI summary display, and downloadable AI log.
  */
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { Clock, Calendar, ArrowLeft, Upload, AlertCircle, Sparkles, Key, X } from 'lucide-react';
 import { marked } from 'marked';
 
@@ -26,14 +26,350 @@ type Summaries = {
   [date: string]: string;
 };
 
+type EntriesByDate = {
+  [date: string]: Entry[];
+};
+
+// Parsed entries indexed for the views. Batches are added in place, so a render is
+// triggered by bumping a revision counter instead of copying every entry.
+interface EntryStore {
+  count: number;
+  byDate: EntriesByDate;
+  dates: string[]; // Unique dates (YYYY-MM-DD), newest first
+  groupedDates: GroupedDates;
+}
+
+// Messages posted back by the parser worker
+type ParserMessage =
+  | { type: 'batch'; entries: Entry[]; replace: boolean }
+  | { type: 'done' | 'missing' }
+  | { type: 'error'; message: string };
+
+type ParserResult = 'done' | 'missing' | 'cancelled';
+
+interface ParserRequest {
+  url?: string;
+  restore?: boolean;
+  file?: Blob;
+}
+
+const LIST_OVERSCAN = 3; // Extra items rendered above and below the visible window
+const RENDER_INTERVAL_MS = 200; // Minimum delay between re-renders while entries stream in
+const MONTH_NAMES = Array.from({ length: 12 }, (_, m) => new Date(2000, m, 1).toLocaleString('en-US', { month: 'long' }));
+
+// Source of the parser worker. Kept as plain JavaScript so it runs unchanged from a Blob URL.
+const PARSER_WORKER_SOURCE = String.raw`
+// Parser worker: streams pomodoro.txt off the main thread and keeps the parsed entries in IndexedDB.
+// Request: { url, restore } to sync with the server, or { file } to parse an uploaded file.
+// Replies with { type: 'batch', entries, replace } as lines are parsed, then exactly one of
+// { type: 'done' }, { type: 'missing' } (server had no file) or { type: 'error', message }.
+const BATCH_MS = 200; // Maximum delay between posted batches
+const BATCH_SIZE = 5000; // Maximum entries per batch, keeping each update on the page short
+const FNV_OFFSET = 0x811c9dc5; // 32-bit FNV-1a parameters, used to hash the bytes already parsed
+const FNV_PRIME = 0x01000193;
+const EMPTY_SYNC = { offset: 0, hash: FNV_OFFSET };
+const ENTRY_REGEX = /\[(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}:\d{2})\]\s*\(([^)]*)\):?\s*(.+)/;
+
+// Expected format: [YYYY-MM-DD HH:MM:SS] (tag) note content
+const parseEntry = (line) => {
+  const match = line.match(ENTRY_REGEX);
+  if (!match) return null;
+  const [, datePart, timePart, tag, note] = match;
+  return {
+    timestamp: new Date(datePart + 'T' + timePart).toISOString(),
+    tag: tag.trim(),
+    note: note.trim()
+  };
+};
+
+const hashBytes = (hash, bytes) => {
+  for (let i = 0; i < bytes.length; i++) {
+    hash = Math.imul(hash ^ bytes[i], FNV_PRIME);
+  }
+  return hash;
+};
+
+const concatBytes = (a, b) => {
+  const bytes = new Uint8Array(a.length + b.length);
+  bytes.set(a);
+  bytes.set(b, a.length);
+  return bytes;
+};
+
+const requestResult = (request) => new Promise((resolve, reject) => {
+  request.onsuccess = () => resolve(request.result);
+  request.onerror = () => reject(request.error);
+});
+
+// Resolves to null when IndexedDB is unavailable (e.g. private browsing); nothing is cached then
+const openDb = () => new Promise((resolve) => {
+  try {
+    const request = indexedDB.open('pomodoro_review', 1);
+    request.onupgradeneeded = () => {
+      request.result.createObjectStore('chunks', { autoIncrement: true });
+      request.result.createObjectStore('meta');
+    };
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => resolve(null);
+  } catch (e) {
+    resolve(null);
+  }
+});
+
+// Sync point: byte offset in pomodoro.txt just past the last complete line the cached entries
+// came from, plus a hash of every byte before it so an edited file can be detected.
+const readSync = async (db) => {
+  if (!db) return EMPTY_SYNC;
+  return (await requestResult(db.transaction('meta').objectStore('meta').get('sync'))) || EMPTY_SYNC;
+};
+
+// Posts every cached chunk of entries, the first one replacing whatever the page shows
+const restore = (db) => new Promise((resolve, reject) => {
+  let replace = true;
+  if (!db) {
+    self.postMessage({ type: 'batch', entries: [], replace });
+    resolve();
+    return;
+  }
+  const request = db.transaction('chunks').objectStore('chunks').openCursor();
+  request.onsuccess = () => {
+    const cursor = request.result;
+    if (!cursor) {
+      if (replace) self.postMessage({ type: 'batch', entries: [], replace });
+      resolve();
+      return;
+    }
+    self.postMessage({ type: 'batch', entries: cursor.value, replace });
+    replace = false;
+    cursor.continue();
+  };
+  request.onerror = () => reject(request.error);
+});
+
+// Stores new chunks and the sync point in one transaction, so the cache never covers half a sync
+const commit = (db, chunks, sync, replace) => new Promise((resolve, reject) => {
+  if (!db) {
+    resolve();
+    return;
+  }
+  const transaction = db.transaction(['chunks', 'meta'], 'readwrite');
+  const store = transaction.objectStore('chunks');
+  if (replace) store.clear();
+  chunks.forEach(chunk => store.add(chunk));
+  transaction.objectStore('meta').put(sync, 'sync');
+  transaction.oncomplete = () => resolve();
+  transaction.onerror = () => reject(transaction.error);
+  transaction.onabort = () => reject(transaction.error);
+});
+
+// Parses entries from a byte stream as it arrives, posting them in batches and keeping them in chunks.
+// Bytes before base.offset are only hashed and must match base.hash; entries after it then extend the
+// current ones. With an empty sync point the entries replace the current ones. A last line without a
+// newline may still be being written, so it is left for the next sync unless lastLine is set.
+const streamEntries = async (body, base, chunks, lastLine) => {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  let position = 0;
+  let hash = FNV_OFFSET; // Hash of the bytes up to the last complete line
+  let unhashed = new Uint8Array(0); // Bytes of the incomplete last line
+  let partial = ''; // Incomplete last line, carried over to the next chunk
+  let pending = [];
+  let replace = base.offset === 0;
+  let lastFlush = Date.now();
+
+  const flush = () => {
+    if (pending.length === 0 && !replace) return;
+    self.postMessage({ type: 'batch', entries: pending, replace });
+    if (pending.length > 0) chunks.push(pending);
+    pending = [];
+    replace = false;
+    lastFlush = Date.now();
+  };
+
+  const parseLines = (text) => {
+    const lines = (partial + text).split('\n');
+    partial = lines.pop() || '';
+    lines.forEach(line => {
+      const entry = line.trim() ? parseEntry(line) : null;
+      if (entry) pending.push(entry);
+      if (pending.length >= BATCH_SIZE) flush();
+    });
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+
+    let chunk = value;
+    if (position < base.offset) {
+      const skipped = chunk.subarray(0, base.offset - position);
+      hash = hashBytes(hash, skipped);
+      position += skipped.length;
+      chunk = chunk.subarray(skipped.length);
+      if (position === base.offset && hash !== base.hash) {
+        await reader.cancel();
+        return { mismatch: true };
+      }
+      if (chunk.length === 0) continue;
+    }
+
+    position += chunk.length;
+    const lineEnd = chunk.lastIndexOf(10) + 1; // Just past the last newline, 0 if there is none
+    if (lineEnd > 0) {
+      hash = hashBytes(hashBytes(hash, unhashed), chunk.subarray(0, lineEnd));
+      unhashed = chunk.slice(lineEnd);
+    } else {
+      unhashed = concatBytes(unhashed, chunk);
+    }
+    parseLines(decoder.decode(chunk, { stream: true }));
+    if (Date.now() - lastFlush >= BATCH_MS) flush();
+  }
+
+  if (position < base.offset) {
+    return { mismatch: true };
+  }
+
+  if (lastLine) parseLines(decoder.decode() + '\n');
+  flush();
+  return { mismatch: false, sync: { offset: position - unhashed.length, hash } };
+};
+
+self.onmessage = async ({ data }) => {
+  try {
+    const db = await openDb();
+    const chunks = [];
+
+    if (data.file) {
+      await streamEntries(data.file.stream(), EMPTY_SYNC, chunks, true);
+      // An uploaded file is unrelated to the server copy, so the next sync starts from scratch
+      await commit(db, chunks, EMPTY_SYNC, true);
+      self.postMessage({ type: 'done' });
+      return;
+    }
+
+    if (data.restore) await restore(db);
+
+    // The whole file is read so the part already parsed can be checked against the stored hash,
+    // but only lines appended since the last sync are parsed
+    let base = await readSync(db);
+    let response = await fetch(data.url);
+    if (!response.ok || !response.body) {
+      self.postMessage({ type: 'missing' });
+      return;
+    }
+
+    let result = await streamEntries(response.body, base, chunks, false);
+    if (result.mismatch) {
+      // File was edited or truncated rather than appended to, so parse it from scratch
+      base = EMPTY_SYNC;
+      response = await fetch(data.url);
+      if (!response.ok || !response.body) {
+        self.postMessage({ type: 'missing' });
+        return;
+      }
+      result = await streamEntries(response.body, base, chunks, false);
+    }
+
+    await commit(db, chunks, result.sync, base.offset === 0);
+    self.postMessage({ type: 'done' });
+  } catch (error) {
+    self.postMessage({ type: 'error', message: String(error) });
+  }
+};
+`;
+
+const PARSER_WORKER_URL = URL.createObjectURL(new Blob([PARSER_WORKER_SOURCE], { type: 'text/javascript' }));
+
+const emptyStore = (): EntryStore => ({ count: 0, byDate: {}, dates: [], groupedDates: {} });
+
+/**
+ * Organizes dates (newest first) into a hierarchical structure (Year -> Month -> Dates).
+ */
+const groupDates = (dates: string[]): GroupedDates => {
+  const grouped: GroupedDates = {};
+  dates.forEach(date => {
+    const year = date.slice(0, 4);
+    const month = MONTH_NAMES[parseInt(date.slice(5, 7), 10) - 1];
+
+    if (!grouped[year]) {
+      grouped[year] = {};
+    }
+    if (!grouped[year][month]) {
+      grouped[year][month] = [];
+    }
+    grouped[year][month].push(date);
+  });
+  return grouped;
+};
+
+/**
+ * Scrollable list that only mounts the items currently in view.
+ * Items keep their natural height: each is measured once rendered, and unmeasured items count as `estimatedHeight`.
+ */
+const VirtualList = ({ count, itemKey, estimatedHeight, renderItem }: {
+  count: number;
+  itemKey: (index: number) => string;
+  estimatedHeight: number;
+  renderItem: (index: number) => React.ReactNode;
+}) => {
+  const [scrollTop, setScrollTop] = useState<number>(0);
+  const [, setLayoutVersion] = useState<number>(0); // Bumped when a measured height changes
+  const heights = useRef<Map<string, number>>(new Map());
+  const viewportHeight = Math.round(window.innerHeight * 0.7);
+
+  // Top offset of every item
+  const tops: number[] = [0];
+  for (let i = 0; i < count; i++) {
+    tops.push(tops[i] + (heights.current.get(itemKey(i)) ?? estimatedHeight));
+  }
+
+  let first = 0;
+  while (first < count && tops[first + 1] <= scrollTop) first++;
+  let last = first;
+  while (last < count && tops[last] < scrollTop + viewportHeight) last++;
+  first = Math.max(0, first - LIST_OVERSCAN);
+  last = Math.min(count, last + LIST_OVERSCAN);
+
+  const measure = (key: string) => (node: HTMLDivElement | null) => {
+    if (node && heights.current.get(key) !== node.offsetHeight) {
+      heights.current.set(key, node.offsetHeight);
+      setLayoutVersion(v => v + 1);
+    }
+  };
+
+  const items: React.ReactNode[] = [];
+  for (let i = first; i < last; i++) {
+    const key = itemKey(i);
+    items.push(
+      <div key={key} ref={measure(key)} style={{ position: 'absolute', top: tops[i], left: 0, right: 0 }}>
+        {renderItem(i)}
+      </div>
+    );
+  }
+
+  return (
+    <div
+      style={{ maxHeight: viewportHeight, overflowY: 'auto' }}
+      onScroll={(e) => setScrollTop(e.currentTarget.scrollTop)}
+    >
+      <div style={{ height: tops[count], position: 'relative' }}>
+        {items}
+      </div>
+    </div>
+  );
+};
+
 const TimeTracker = () => {
   // --- Application State ---
-  const [entries, setEntries] = useState<Entry[]>([]); // Array of parsed pomodoro entries
+  const storeRef = useRef<EntryStore>(emptyStore()); // Parsed pomodoro entries, indexed by date and grouped by Year and Month
+  const [revision, setRevision] = useState<number>(0); // Bumped whenever entries are added to the store
   const [view, setView] = useState<string>('loading'); // Current active view: 'loading', 'upload', 'overview', 'details', 'all'
-  const [dates, setDates] = useState<string[]>([]); // Array of unique date strings (YYYY-MM-DD)
-  const [groupedDates, setGroupedDates] = useState<GroupedDates>({}); // Dates grouped by Year and Month for hierarchical navigation
   const [selectedDate, setSelectedDate] = useState<string | null>(null); // The date selected by the user for detailed review
   const [loadingError, setLoadingError] = useState<string | null>(null); // Stores any errors encountered during file loading
+  const parserRef = useRef<{ worker: Worker; finish: (result: ParserResult | Error) => void } | null>(null); // Parser worker currently running
+  const loadingRef = useRef<boolean>(false); // True while loadData is syncing with the server
+  const restoredRef = useRef<boolean>(false); // True once the store holds the entries cached in IndexedDB
+  const renderTimerRef = useRef<number | null>(null); // Pending re-render after entries were added
 
   // --- Gemini AI State ---
   const [apiKey, setApiKey] = useState<string>(localStorage.getItem('gemini_api_key') || ''); // API key for Google Gemini
@@ -46,8 +382,7 @@ const TimeTracker = () => {
   }, []);
 
   useEffect(() => {
-    if (entries.length > 0) {
-      extractAndGroupDates();
+    if (storeRef.current.count > 0) {
       // Determine initial view if not already set or invalid
       if (view === 'loading' || view === 'upload') {
         setView('overview');
@@ -55,7 +390,7 @@ const TimeTracker = () => {
     } else if (view !== 'loading') {
       if (view !== 'upload') setView('upload');
     }
-  }, [entries]);
+  }, [revision]);
 
   const saveApiKey = (key: string) => {
     setApiKey(key);
@@ -64,9 +399,14 @@ const TimeTracker = () => {
   };
 
   /**
-   * Loads data from localStorage cache and attempts to fetch fresh data from 'pomodoro.txt'.
+   * Loads AI summaries and syncs entries with 'pomodoro.txt' through the parser worker.
+   * The first load restores entries cached in IndexedDB; after that only appended lines are parsed.
    */
   const loadData = async () => {
+    // A sync is already streaming and will pick up everything written so far
+    if (loadingRef.current) return;
+    loadingRef.current = true;
+
     // 1. Load AI summaries from cache
     const cachedSummaries = localStorage.getItem('pomodoro_summaries');
     if (cachedSummaries) {
@@ -77,93 +417,101 @@ const TimeTracker = () => {
       }
     }
 
-    // 2. Try loading pomodoro data from localStorage cache first
-    const cachedData = localStorage.getItem('pomodoro_data');
-    if (cachedData) {
-      parseFileContent(cachedData);
-    }
-
-    // 3. Attempt to fetch fresh pomodoro data from the server
     try {
-      const response = await fetch('pomodoro.txt');
-      if (response.ok) {
-        const text = await response.text();
-        // Only trigger update if content has changed
-        if (text !== cachedData) {
-          localStorage.setItem('pomodoro_data', text);
-          parseFileContent(text);
-        }
-      } else {
-        if (!cachedData) throw new Error('File not found');
+      // 2. Move the raw text cached in localStorage by older versions into IndexedDB
+      const legacyData = localStorage.getItem('pomodoro_data');
+      if (legacyData) {
+        if (await runParser({ file: new Blob([legacyData]) }) === 'cancelled') return;
+        localStorage.removeItem('pomodoro_data');
+        restoredRef.current = true;
       }
+
+      // 3. Restore cached entries (first load only), then parse what was appended to the file
+      const result = await runParser({
+        url: new URL('pomodoro.txt', location.href).href,
+        restore: !restoredRef.current
+      });
+      if (result === 'cancelled') return;
+      restoredRef.current = true;
+      if (storeRef.current.count === 0) throw new Error(result === 'missing' ? 'File not found' : 'No entries found');
     } catch (error) {
+      // Batches from a failed sync may already be in the store, so restore from the cache next time
+      restoredRef.current = false;
       console.log('Auto-load failed', error);
-      if (!cachedData) {
+      if (storeRef.current.count === 0) {
         setLoadingError('Could not load pomodoro.txt and no cache found.');
         setView('upload');
       }
+    } finally {
+      loadingRef.current = false;
     }
   };
 
   /**
-   * Extracts unique dates from entries and organizes them into a hierarchical structure (Year -> Month -> Dates).
+   * Runs the parser worker, adding its batches to the store as they arrive.
+   * Starting a new run cancels the one in flight. Its batches were never cached, so a sync that
+   * cancels another run rebuilds the store from the cache first.
    */
-  const extractAndGroupDates = () => {
-    const uniqueDates = [...new Set(entries.map((entry: Entry) => {
-      const date = new Date(entry.timestamp);
-      return date.toISOString().split('T')[0];
-    }))].sort().reverse();
-
-    setDates(uniqueDates);
-
-    const grouped: GroupedDates = {};
-    uniqueDates.forEach(date => {
-      const dateObj = new Date(date);
-      const year = dateObj.getFullYear().toString();
-      const month = dateObj.toLocaleString('en-US', { month: 'long' });
-
-      if (!grouped[year]) {
-        grouped[year] = {};
-      }
-      if (!grouped[year][month]) {
-        grouped[year][month] = [];
-      }
-      grouped[year][month].push(date);
-    });
+  const runParser = (request: ParserRequest): Promise<ParserResult> => {
+    const previous = parserRef.current;
+    previous?.finish('cancelled');
+    const message = previous && request.url ? { ...request, restore: true } : request;
+    return new Promise((resolve, reject) => {
+      const worker = new Worker(PARSER_WORKER_URL);
+      const finish = (result: ParserResult | Error) => {
+        worker.terminate();
+        if (parserRef.current?.worker === worker) parserRef.current = null;
+        if (result instanceof Error) reject(result);
+        else resolve(result);
+      };
+      parserRef.current = { worker, finish };
 
-    setGroupedDates(grouped);
+      worker.onmessage = ({ data }: MessageEvent<ParserMessage>) => {
+        if (parserRef.current?.worker !== worker) return; // Cancelled; ignore anything still queued
+        if (data.type === 'batch') addEntries(data.entries, data.replace);
+        else if (data.type === 'error') finish(new Error(data.message));
+        else finish(data.type);
+      };
+      worker.onerror = (event) => finish(new Error(event.message));
+      worker.postMessage(message);
+    });
   };
 
   /**
-   * Parses a single line from the pomodoro file using regex.
-   * Expected format: [YYYY-MM-DD HH:MM:SS] (tag) note content
+   * Adds a batch of parsed entries to the store, only touching the dates in the batch.
+   * @param batch Entries in file order.
+   * @param replace Start a new store instead of extending the current one.
    */
-  const parseEntry = (line: string): Entry | null => {
-    const regex = /\[(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}:\d{2})\]\s*\(([^)]*)\):?\s*(.+)/;
-    const match = line.match(regex);
-
-    if (match) {
-      const [, datePart, timePart, tag, note] = match;
-      const timestamp = `${datePart}T${timePart}`;
-      return {
-        timestamp: new Date(timestamp).toISOString(),
-        tag: tag.trim(),
-        note: note.trim()
-      };
+  const addEntries = (batch: Entry[], replace: boolean) => {
+    const store = replace ? emptyStore() : storeRef.current;
+    let newDates = replace;
+    batch.forEach(entry => {
+      const date = entry.timestamp.split('T')[0];
+      if (!store.byDate[date]) {
+        store.byDate[date] = [];
+        newDates = true;
+      }
+      store.byDate[date].push(entry);
+    });
+    store.count += batch.length;
+
+    if (newDates) {
+      store.dates = Object.keys(store.byDate).sort().reverse();
+      store.groupedDates = groupDates(store.dates);
     }
-    return null;
+    storeRef.current = store;
+    scheduleRender();
   };
 
   /**
-   * Splits multi-line text into lines, parses each, and updates state.
+   * Re-renders once per RENDER_INTERVAL_MS at most, however many batches arrive in between.
    */
-  const parseFileContent = (text: string) => {
-    const lines = text.split('\n').filter(line => line.trim());
-    const parsedEntries = lines
-      .map(line => parseEntry(line))
-      .filter((entry): entry is Entry => entry !== null);
-
-    setEntries(parsedEntries);
+  const scheduleRender = () => {
+    if (renderTimerRef.current !== null) return;
+    renderTimerRef.current = window.setTimeout(() => {
+      renderTimerRef.current = null;
+      setRevision(r => r + 1);
+    }, RENDER_INTERVAL_MS);
   };
 
   const saveToAiLog = (dateStr: string, summaryText: string) => {
@@ -306,11 +654,11 @@ Use professional but encouraging tone and provide points.`,
     if (!file) return;
 
     try {
-      const text = await file.text();
-      localStorage.setItem('pomodoro_data', text);
-      parseFileContent(text);
+      // Replaces the entries and the cache, cancelling any sync still streaming
+      if (await runParser({ file }) === 'done') restoredRef.current = true;
       setView('overview');
     } catch (error) {
+      restoredRef.current = false;
       console.error('Error reading file:', error);
       alert('Error reading file. Please try again.');
     }
@@ -332,10 +680,7 @@ Use professional but encouraging tone and provide points.`,
   };
 
   const getEntriesForDate = (dateStr: string) => {
-    return entries.filter((entry: Entry) => {
-      const entryDate = new Date(entry.timestamp).toISOString().split('T')[0];
-      return entryDate === dateStr;
-    });
+    return storeRef.current.byDate[dateStr] || [];
   };
 
   const handleDateSelect = (dateStr: string) => {
@@ -357,6 +702,8 @@ Use professional but encouraging tone and provide points.`,
     );
   };
 
+  const { count, dates, groupedDates } = storeRef.current;
+
   if (view === 'loading') {
     return (
       <div className="flex items-center justify-center min-h-screen text-gray-400">
@@ -365,7 +712,7 @@ Use professional but encouraging tone and provide points.`,
     );
   }
 
-  if (view === 'upload' && entries.length === 0) {
+  if (view === 'upload' && count === 0) {
     return (
       <div className="max-w-4xl mx-auto p-4 bg-gray-900 min-h-screen">
         <div className="bg-gray-800 rounded-lg shadow-lg p-6 border border-gray-700">
@@ -518,25 +865,34 @@ Use professional but encouraging tone and provide points.`,
             </div>
           )}
 
-          <div className="space-y-1">
-            {dateEntries.map((entry, idx) => (
-              <div key={idx} className="border-l-4 border-blue-500 pl-2 py-1 bg-gray-900/50 rounded hover:bg-gray-900 transition-colors">
-                <div className="flex items-start">
-                  <span className="font-mono text-xs text-gray-500 mr-2 mt-0.5">
-                    [{formatTime(entry.timestamp)}]
-                  </span>
-                  {entry.tag && (
-                    <span className="text-xs font-semibold text-blue-400 mr-2 mt-0.5">
-                      ({entry.tag})
-                    </span>
-                  )}
-                  <span className="text-sm text-gray-300 flex-1">
-                    {entry.note}
-                  </span>
+          <VirtualList
+            key={selectedDate}
+            count={dateEntries.length}
+            itemKey={(index) => String(index)}
+            estimatedHeight={32}
+            renderItem={(index) => {
+              const entry = dateEntries[index];
+              return (
+                <div className="pb-1">
+                  <div className="border-l-4 border-blue-500 pl-2 py-1 bg-gray-900/50 rounded hover:bg-gray-900 transition-colors">
+                    <div className="flex items-start">
+                      <span className="font-mono text-xs text-gray-500 mr-2 mt-0.5">
+                        [{formatTime(entry.timestamp)}]
+                      </span>
+                      {entry.tag && (
+                        <span className="text-xs font-semibold text-blue-400 mr-2 mt-0.5">
+                          ({entry.tag})
+                        </span>
+                      )}
+                      <span className="text-sm text-gray-300 flex-1">
+                        {entry.note}
+                      </span>
+                    </div>
+                  </div>
                 </div>
-              </div>
-            ))}
-          </div>
+              );
+            }}
+          />
 
           <button
             onClick={() => { setSelectedDate(null); setView('all'); }}
@@ -550,6 +906,15 @@ Use professional but encouraging tone and provide points.`,
   }
 
   if (view === 'overview') {
+    // One list item per month; first is the number of dates listed before it
+    const months: { year: string; month: string; first: number }[] = [];
+    Object.keys(groupedDates).sort().reverse().forEach(year => {
+      Object.keys(groupedDates[year]).forEach(month => {
+        const previous = months[months.length - 1];
+        months.push({ year, month, first: previous ? previous.first + groupedDates[previous.year][previous.month].length : 0 });
+      });
+    });
+
     return (
       <div className="max-w-4xl mx-auto p-2 bg-gray-900 min-h-screen">
         <div className="bg-gray-800 rounded-lg shadow-lg p-3 border border-gray-700">
@@ -561,48 +926,48 @@ Use professional but encouraging tone and provide points.`,
           {dates.length === 0 ? (
             <p className="text-gray-500 text-center py-6">No entries found.</p>
           ) : (
-            <div className="space-y-4">
-              {Object.keys(groupedDates).sort((a, b) => b - a).map(year => (
-                <div key={year}>
-                  <div className="sticky top-0 bg-gray-800 py-1 z-10">
-                    <h3 className="text-lg font-bold text-blue-400">{year}</h3>
-                  </div>
-                  {Object.keys(groupedDates[year]).map(month => {
-                    const monthDates = groupedDates[year][month];
-                    return (
-                      <div key={month} className="mb-3 ml-2">
-                        <h4 className="text-sm font-semibold text-gray-500 uppercase tracking-wider mb-2">{month}</h4>
-                        <div className="grid grid-cols-1 gap-2">
-                          {monthDates.map((date) => {
-                            const globalIndex = dates.indexOf(date);
-                            const count = getEntriesForDate(date).length;
-                            return (
-                              <button
-                                key={date}
-                                onClick={() => handleDateSelect(date)}
-                                className="group flex items-center justify-between p-2 bg-gray-900 hover:bg-gray-700 rounded border border-gray-700 hover:border-blue-500 transition-all text-left"
-                              >
-                                <div className="flex items-center">
-                                  <span className="font-mono text-sm text-gray-600 group-hover:text-blue-400 w-8">
-                                    {(globalIndex + 1).toString().padStart(2, '0')}
-                                  </span>
-                                  <span className="text-gray-200 text-sm font-medium">
-                                    {formatDate(date)}
-                                  </span>
-                                </div>
-                                <span className="text-xs bg-gray-800 px-2 py-0.5 rounded text-gray-400 group-hover:text-white">
-                                  {count}
+            <VirtualList
+              count={months.length}
+              itemKey={(index) => `${months[index].year}-${months[index].month}`}
+              estimatedHeight={400}
+              renderItem={(index) => {
+                const { year, month, first } = months[index];
+                return (
+                  <div className="pb-3">
+                    {(index === 0 || months[index - 1].year !== year) && (
+                      <h3 className="text-lg font-bold text-blue-400 py-1">{year}</h3>
+                    )}
+                    <div className="ml-2">
+                      <h4 className="text-sm font-semibold text-gray-500 uppercase tracking-wider mb-2">{month}</h4>
+                      <div className="grid grid-cols-1 gap-2">
+                        {groupedDates[year][month].map((date, i) => {
+                          const count = getEntriesForDate(date).length;
+                          return (
+                            <button
+                              key={date}
+                              onClick={() => handleDateSelect(date)}
+                              className="group flex items-center justify-between p-2 bg-gray-900 hover:bg-gray-700 rounded border border-gray-700 hover:border-blue-500 transition-all text-left"
+                            >
+                              <div className="flex items-center">
+                                <span className="font-mono text-sm text-gray-600 group-hover:text-blue-400 w-8">
+                                  {String(first + i + 1).padStart(2, '0')}
                                 </span>
-                              </button>
-                            );
-                          })}
-                        </div>
+                                <span className="text-gray-200 text-sm font-medium">
+                                  {formatDate(date)}
+                                </span>
+                              </div>
+                              <span className="text-xs bg-gray-800 px-2 py-0.5 rounded text-gray-400 group-hover:text-white">
+                                {count}
+                              </span>
+                            </button>
+                          );
+                        })}
                       </div>
-                    );
-                  })}
-                </div>
-              ))}
-            </div>
+                    </div>
+                  </div>
+                );
+              }}
+            />
           )}
 
           <button
@@ -634,11 +999,15 @@ Use professional but encouraging tone and provide points.`,
           </button>
         </div>
 
-        {entries.length === 0 ? (
+        {count === 0 ? (
           <p className="text-gray-500 text-center py-6">No entries found.</p>
         ) : (
-          <div className="space-y-4">
-            {dates.map(date => {
+          <VirtualList
+            count={dates.length}
+            itemKey={(index) => dates[index]}
+            estimatedHeight={160}
+            renderItem={(index) => {
+              const date = dates[index];
               const dateEntries = getEntriesForDate(date);
               const dateObj = new Date(date);
               const dateHeader = dateObj.toLocaleDateString('en-US', {
@@ -649,7 +1018,7 @@ Use professional but encouraging tone and provide points.`,
               });
 
               return (
-                <div key={date}>
+                <div className="pb-4">
                   <h3 className="text-sm font-bold text-blue-400 bg-gray-900/50 px-2 py-1 rounded mb-1 border-l-2 border-blue-500">
                     {dateHeader}
                   </h3>
@@ -666,8 +1035,8 @@ Use professional but encouraging tone and provide points.`,
                   </div>
                 </div>
               );
-            })}
-          </div>
+            }}
+          />
         )}
         <p className="text-xs text-gray-600 mt-4 text-center border-t border-gray-800 pt-2">
           Data is processed locally. Entries are sent to Google Gemini only when you click "Generate AI Summary".